@@ -19,9 +19,14 @@ import argparse
 import signal
 import re
 import time
+import shutil
+import tempfile
+import heapq
+from operator import itemgetter
 from datetime import datetime, timedelta
+from urllib.parse import unquote
 from typing import List, Dict, Any, Optional
-import pytz
+from zoneinfo import ZoneInfo
 
 try:
     from google.auth.transport.requests import Request
@@ -40,7 +45,18 @@ QUOTA_FILE = 'json_cache/quota.json'
 TIMESTAMP_FILE = 'json_cache/playlist_timestamps.json'
 ADDED_VIDEOS_TTL_DAYS = 7
 CSV_LOG_FILE = 'json_cache/added_videos.csv'
+INSERT_INTERVAL_SECONDS = 0.5  # Minimum spacing between playlistItems.insert calls
+CHANNEL_ID_RE = re.compile(r'UC[\w-]{22}')  # Bare channel ID (use with fullmatch)
+# youtube.com/channel/<id>, /@handle, /c/<name> and /user/<name> channel URLs
+# (names capture the whole path segment: handles may contain '·' or be percent-encoded)
+CHANNEL_URL_RE = re.compile(r'youtube\.com/(?:channel/(UC[\w-]{22})|@([^/?#\s]+)|c/([^/?#\s]+)|user/([^/?#\s]+))')
+PACIFIC_TZ = ZoneInfo('America/Los_Angeles')  # Display timezone and quota reset day
+API_NUM_RETRIES = 3  # Retries with backoff for read calls on 5xx/429/rate-limit errors (inserts are not retried)
+ISO_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')  # videos.list contentDetails.duration
+FILTER_DURATION_RE = re.compile(r'^(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?$', re.IGNORECASE)  # min/max_duration like 1h30m
 
+# Plain flag rather than threading.Event: Event.set() takes a non-reentrant lock, so a
+# SIGINT arriving while the main thread sits in Event.wait() could deadlock the handler
 shutdown_requested = False
 
 def signal_handler(signum, frame):
@@ -48,12 +64,49 @@ def signal_handler(signum, frame):
     print(f"\n🛑 Gracefully shutting down...")
     shutdown_requested = True
 
+def interruptible_sleep(seconds: float) -> bool:
+    """Sleep in short slices so Ctrl-C cuts the pause short. Returns True if shutdown was requested."""
+    deadline = time.monotonic() + seconds
+    while not shutdown_requested:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(remaining, 0.1))
+    return True
+
+def write_file_atomic(path: str, content: str, mode: Optional[int] = None):
+    """Write content to a temp file and os.replace() it into place so readers never see a partial file.
+
+    The replacement keeps the existing file's permissions; a new file gets `mode` if given.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        elif mode is not None:
+            os.chmod(tmp_path, mode)
+        else:
+            # mkstemp creates files 0600; give new files the usual umask-based mode
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_json_atomic(path: str, data: Any):
+    """Write data as indented JSON via write_file_atomic()."""
+    write_file_atomic(path, json.dumps(data, indent=2))
+
 def format_pacific_time(iso_str: str, fmt: str = '%Y-%m-%d %H:%M PT') -> str:
     """Convert UTC ISO timestamp to US/Pacific formatted string."""
     try:
-        utc_dt = datetime.fromisoformat(iso_str.replace('Z', '+00:00'))
-        pacific_tz = pytz.timezone('US/Pacific')
-        return utc_dt.astimezone(pacific_tz).strftime(fmt)
+        utc_dt = datetime.fromisoformat(iso_str)
+        return utc_dt.astimezone(PACIFIC_TZ).strftime(fmt)
     except Exception:
         return iso_str
 
@@ -69,6 +122,14 @@ def duration_to_seconds(dur_str: str) -> int:
             return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
     return 0
 
+def format_duration(seconds: int) -> str:
+    """Format a duration in seconds as readable text ('4:13' or '1:05:30')."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
 def parse_filter_duration_seconds(val: Any) -> Optional[int]:
     """Parse filter duration values (like 600, '600', '10:00', '10m', '1h30m') to integer seconds."""
     if val is None:
@@ -83,7 +144,7 @@ def parse_filter_duration_seconds(val: Any) -> Optional[int]:
     if ':' in val_str:
         return duration_to_seconds(val_str)
     
-    match = re.match(r'^(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?$', val_str, re.IGNORECASE)
+    match = FILTER_DURATION_RE.match(val_str)
     if match and any(match.groups()):
         h, m, s = match.groups()
         return (int(h) if h else 0) * 3600 + (int(m) if m else 0) * 60 + (int(s) if s else 0)
@@ -100,8 +161,7 @@ class QuotaTracker:
         self._load_quota()
         
     def _get_pacific_date(self) -> str:
-        pacific_tz = pytz.timezone('US/Pacific')
-        return datetime.now(pacific_tz).strftime('%Y-%m-%d')
+        return datetime.now(PACIFIC_TZ).strftime('%Y-%m-%d')
         
     def _load_quota(self):
         if os.path.exists(self.quota_file):
@@ -115,8 +175,7 @@ class QuotaTracker:
 
     def _save_quota(self):
         try:
-            with open(self.quota_file, 'w') as f:
-                json.dump({'date': self.date_str, 'used': self.used}, f, indent=2)
+            write_json_atomic(self.quota_file, {'date': self.date_str, 'used': self.used})
         except Exception:
             pass
 
@@ -147,11 +206,19 @@ class G3kYouTubePlaylistManager:
         self.token_file = 'token.json'
         os.makedirs('json_cache', exist_ok=True)
         self.channel_cache_file = 'json_cache/channels.json'
+        self.playlist_cache_file = 'json_cache/playlist_ids.json'
         self.added_videos_file = 'json_cache/added_videos.json'
         self.csv_log_file = CSV_LOG_FILE
         self.youtube = None
         self.quota = QuotaTracker()
         self.channel_cache = self._load_channel_cache()
+        self.playlist_cache = self._load_playlist_cache()
+        # ID caches are written once via flush_caches() rather than after every lookup
+        self._channel_cache_dirty = False
+        self._playlist_cache_dirty = False
+        self._playlist_scan_complete = False
+        self._existing_ids_by_playlist: Dict[str, set] = {}  # Complete item scans from this run
+        self._unresolved_channels = set()  # Inputs a search found nothing for this run
         self.added_videos = self._load_added_videos()
         
     def _log_added_video_csv(self, playlist_title: str, video: Dict[str, Any]):
@@ -164,8 +231,9 @@ class G3kYouTubePlaylistManager:
                     writer.writerow(['timestamp', 'playlist_name', 'channel_name', 'video_name', 'duration_seconds'])
                 
                 now_str = datetime.now().isoformat()
-                dur_str = video.get('duration', '0:00')
-                duration_seconds = duration_to_seconds(dur_str)
+                duration_seconds = video.get('duration_seconds')
+                if duration_seconds is None:
+                    duration_seconds = duration_to_seconds(video.get('duration', '0:00'))
                 
                 writer.writerow([
                     now_str,
@@ -181,7 +249,8 @@ class G3kYouTubePlaylistManager:
     def _load_added_videos(self) -> Dict[str, Dict[str, str]]:
         """Load added videos mapping: playlist_title -> {video_id: timestamp_iso} and prune entries older than ADDED_VIDEOS_TTL_DAYS."""
         now = datetime.now()
-        cutoff = now - timedelta(days=ADDED_VIDEOS_TTL_DAYS)
+        # Timestamps are written by datetime.isoformat(), so string order matches time order
+        cutoff_iso = (now - timedelta(days=ADDED_VIDEOS_TTL_DAYS)).isoformat()
         added_data: Dict[str, Dict[str, str]] = {}
         pruned_count = 0
 
@@ -199,8 +268,7 @@ class G3kYouTubePlaylistManager:
                     elif isinstance(items, dict):
                         for vid, ts_str in items.items():
                             try:
-                                ts = datetime.fromisoformat(ts_str)
-                                if ts >= cutoff:
+                                if ts_str >= cutoff_iso:
                                     added_data[playlist][vid] = ts_str
                                 else:
                                     pruned_count += 1
@@ -217,22 +285,19 @@ class G3kYouTubePlaylistManager:
     def _save_added_videos(self):
         """Save added videos tracking to JSON, filtering out entries older than ADDED_VIDEOS_TTL_DAYS."""
         try:
-            now = datetime.now()
-            cutoff = now - timedelta(days=ADDED_VIDEOS_TTL_DAYS)
+            cutoff_iso = (datetime.now() - timedelta(days=ADDED_VIDEOS_TTL_DAYS)).isoformat()
             pruned_data = {}
             for playlist, items in self.added_videos.items():
                 playlist_items = {}
                 for vid, ts_str in items.items():
                     try:
-                        ts = datetime.fromisoformat(ts_str)
-                        if ts >= cutoff:
+                        if ts_str >= cutoff_iso:
                             playlist_items[vid] = ts_str
                     except Exception:
                         playlist_items[vid] = ts_str
                 pruned_data[playlist] = playlist_items
 
-            with open(self.added_videos_file, 'w') as f:
-                json.dump(pruned_data, f, indent=2)
+            write_json_atomic(self.added_videos_file, pruned_data)
         except Exception as e:
             print(f"Warning: Could not save added videos tracking: {e}")
     
@@ -248,12 +313,40 @@ class G3kYouTubePlaylistManager:
 
     def _save_channel_cache(self):
         try:
-            with open(self.channel_cache_file, 'w') as f:
-                json.dump(self.channel_cache, f, indent=2)
+            write_json_atomic(self.channel_cache_file, self.channel_cache)
         except Exception as e:
             print(f"Warning: Could not save channel cache: {e}")
     
+    def _load_playlist_cache(self) -> Dict[str, str]:
+        """Load playlist title -> playlist ID mapping."""
+        if os.path.exists(self.playlist_cache_file):
+            try:
+                with open(self.playlist_cache_file, 'r') as f:
+                    return json.load(f)
+            except:
+                pass
+        return {}
+    
+    def _save_playlist_cache(self):
+        try:
+            write_json_atomic(self.playlist_cache_file, self.playlist_cache)
+        except Exception as e:
+            print(f"Warning: Could not save playlist cache: {e}")
+    
+    def flush_caches(self):
+        """Write channel and playlist ID caches to disk if they changed during this run."""
+        if self._channel_cache_dirty:
+            self._save_channel_cache()
+            self._channel_cache_dirty = False
+        if self._playlist_cache_dirty:
+            self._save_playlist_cache()
+            self._playlist_cache_dirty = False
+    
     def authenticate(self) -> bool:
+        # Already authenticated earlier in this run
+        if self.youtube is not None:
+            return True
+        
         creds = None
         
         if os.path.exists(self.token_file):
@@ -270,55 +363,87 @@ class G3kYouTubePlaylistManager:
                 flow = InstalledAppFlow.from_client_secrets_file(self.credentials_file, SCOPES)
                 creds = flow.run_local_server(port=0)
             
-            with open(self.token_file, 'w') as token:
-                token.write(creds.to_json())
+            # Holds the refresh token: keep it owner-only when first created
+            write_file_atomic(self.token_file, creds.to_json(), mode=0o600)
         
-        self.youtube = build('youtube', 'v3', credentials=creds)
+        # Use the discovery document bundled with googleapiclient (no network fetch)
+        # and skip the discovery cache autodetection, which is unused with static docs
+        self.youtube = build('youtube', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
         if self.verbose:
             print("✅ Authenticated with YouTube API")
         return True
     
+    def _iter_pages(self, list_method, **kwargs):
+        """Yield response pages from a list method, following nextPageToken while quota allows (1 unit per page)."""
+        page_token = None
+        page_count = 0
+        while True:
+            if not self.quota.can_afford(1):
+                print(f"⚠️ Quota limit reached, stopping at page {page_count}")
+                return
+            
+            response = list_method(pageToken=page_token, **kwargs).execute(num_retries=API_NUM_RETRIES)
+            self.quota.add_cost(1)
+            page_count += 1
+            yield response
+            
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return
+    
     def get_channel_id(self, channel_input: str) -> Optional[str]:
         # Already a channel ID
-        if channel_input.startswith('UC') and len(channel_input) == 24:
+        if CHANNEL_ID_RE.fullmatch(channel_input):
             return channel_input
         
+        # youtube.com/channel/ URLs carry the ID directly
+        url_match = CHANNEL_URL_RE.search(channel_input)
+        if url_match and url_match.group(1):
+            return url_match.group(1)
+        
         # Check cache first
         if channel_input in self.channel_cache:
             if self.verbose:
                 print(f"📦 Using cached channel ID for: {channel_input}")
             return self.channel_cache[channel_input]
         
-        # Extract from URL
-        if 'youtube.com' in channel_input:
-            if '/channel/' in channel_input:
-                channel_id = channel_input.split('/channel/')[-1].split('/')[0]
-                self.channel_cache[channel_input] = channel_id
-                self._save_channel_cache()
-                return channel_id
+        # Already searched for this run without a match - don't pay for the search again
+        if channel_input in self._unresolved_channels:
+            return None
         
-        # Handle support (@username or youtube.com/@username) - costs 1 unit vs 100 for search!
-        handle = None
+        # Handle (@username or youtube.com/@username) and legacy youtube.com/user/name URLs
+        # resolve via channels().list - costs 1 unit vs 100 for search!
+        # Custom youtube.com/c/name URLs have no lookup parameter (custom names aren't handles),
+        # so they go to search with just the custom name as the query.
+        lookup = None
+        search_query = channel_input
         if channel_input.startswith('@'):
-            handle = channel_input[1:]
-        elif 'youtube.com/@' in channel_input:
-            handle = channel_input.split('youtube.com/@')[-1].split('/')[0]
+            lookup = {'forHandle': channel_input[1:]}
+        elif url_match:
+            _, handle, custom_name, username = url_match.groups()
+            if custom_name:
+                search_query = unquote(custom_name)
+            elif handle:
+                lookup = {'forHandle': unquote(handle)}
+            elif username:
+                lookup = {'forUsername': unquote(username)}
             
-        if handle:
+        if lookup:
             if not self.quota.can_afford(1):
                 print(f"⚠️ Not enough quota for channel handle lookup: {channel_input}")
                 return None
             try:
                 response = self.youtube.channels().list(
                     part='id',
-                    forHandle=handle
-                ).execute()
+                    fields='items/id',
+                    **lookup
+                ).execute(num_retries=API_NUM_RETRIES)
                 self.quota.add_cost(1)
                 
                 if response.get('items'):
                     channel_id = response['items'][0]['id']
                     self.channel_cache[channel_input] = channel_id
-                    self._save_channel_cache()
+                    self._channel_cache_dirty = True
                     if self.verbose:
                         print(f"💾 Cached handle mapping: {channel_input} -> {channel_id}")
                     return channel_id
@@ -335,20 +460,22 @@ class G3kYouTubePlaylistManager:
         try:
             response = self.youtube.search().list(
                 part='snippet',
-                q=channel_input,
+                q=search_query,
                 type='channel',
-                maxResults=1
-            ).execute()
+                maxResults=1,
+                fields='items/snippet/channelId'
+            ).execute(num_retries=API_NUM_RETRIES)
             self.quota.add_cost(100)
             
             if response.get('items'):
                 channel_id = response['items'][0]['snippet']['channelId']
                 # Cache the result
                 self.channel_cache[channel_input] = channel_id
-                self._save_channel_cache()
+                self._channel_cache_dirty = True
                 if self.verbose:
                     print(f"💾 Cached channel mapping: {channel_input} -> {channel_id}")
                 return channel_id
+            self._unresolved_channels.add(channel_input)
         except HttpError as e:
             if 'quotaExceeded' in str(e):
                 print("⚠️ API quota exceeded during channel search")
@@ -365,7 +492,7 @@ class G3kYouTubePlaylistManager:
         videos = []
         try:
             # Derive uploads playlist ID if channel_id starts with UC (saves 1 API quota unit)
-            if channel_id.startswith('UC') and len(channel_id) == 24:
+            if CHANNEL_ID_RE.fullmatch(channel_id):
                 uploads_playlist_id = 'UU' + channel_id[2:]
                 channel_title = channel_id
             else:
@@ -374,8 +501,9 @@ class G3kYouTubePlaylistManager:
                     return []
                 channel_response = self.youtube.channels().list(
                     part='contentDetails,snippet',
-                    id=channel_id
-                ).execute()
+                    id=channel_id,
+                    fields='items(snippet/title,contentDetails/relatedPlaylists/uploads)'
+                ).execute(num_retries=API_NUM_RETRIES)
                 self.quota.add_cost(1)
                 
                 if not channel_response.get('items'):
@@ -389,28 +517,20 @@ class G3kYouTubePlaylistManager:
                 print(f"📺 Fetching videos from: {channel_title}")
             
             # Get videos from uploads playlist (1 quota unit per page)
-            next_page_token = None
-            page_count = 0
-            
-            while True:
-                if not self.quota.can_afford(1):
-                    print(f"⚠️ Quota limit reached, stopping at page {page_count}")
-                    break
-                
-                page_count += 1
-                
-                playlist_response = self.youtube.playlistItems().list(
-                    part='snippet',
-                    playlistId=uploads_playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token
-                ).execute()
-                self.quota.add_cost(1)
-                
+            pages = self._iter_pages(
+                self.youtube.playlistItems().list,
+                part='snippet',
+                playlistId=uploads_playlist_id,
+                maxResults=50,
+                fields='nextPageToken,items/snippet(publishedAt,title,channelTitle,resourceId/videoId)'
+            )
+            for playlist_response in pages:
                 stop_fetching = False
                 for item in playlist_response.get('items', []):
-                    video_date = item['snippet']['publishedAt']
-                    item_channel_title = item['snippet'].get('channelTitle') or channel_title
+                    snippet = item['snippet']
+                    video_date = snippet['publishedAt']
+                    # Intern the channel title: it repeats on every item of the page
+                    item_channel_title = sys.intern(snippet.get('channelTitle') or channel_title)
                     if item_channel_title and item_channel_title != channel_id:
                         channel_title = item_channel_title
                     
@@ -422,8 +542,8 @@ class G3kYouTubePlaylistManager:
                         break
                     
                     videos.append({
-                        'video_id': item['snippet']['resourceId']['videoId'],
-                        'title': item['snippet']['title'],
+                        'video_id': snippet['resourceId']['videoId'],
+                        'title': snippet['title'],
                         'published_at': video_date,
                         'channel_title': item_channel_title,
                         'channel_id': channel_id
@@ -431,16 +551,12 @@ class G3kYouTubePlaylistManager:
                 
                 if stop_fetching:
                     break
-                    
-                next_page_token = playlist_response.get('nextPageToken')
-                if not next_page_token:
-                    break
             
             if self.verbose:
                 print(f"📊 Found {len(videos)} videos")
             
             # Sort videos by publication date (oldest first)
-            videos.sort(key=lambda x: x['published_at'])
+            videos.sort(key=itemgetter('published_at'))
             
         except HttpError as e:
             if 'quotaExceeded' in str(e):
@@ -450,20 +566,28 @@ class G3kYouTubePlaylistManager:
         
         return videos
     
-    def get_video_durations(self, video_ids: List[str]) -> Dict[str, str]:
-        """Get durations for a list of video IDs. Returns dict mapping video_id -> duration."""
-        if not video_ids or not self.quota.can_afford(1):
+    def get_video_durations(self, video_ids: List[str]) -> Optional[Dict[str, int]]:
+        """Get durations for a list of video IDs. Returns dict mapping video_id -> duration in seconds.
+
+        Returns None if any batch could not be fetched, so callers don't mistake the
+        missing videos for zero-length ones.
+        """
+        if not video_ids:
             return {}
         
         durations = {}
         try:
             # Process in batches of 50 (API limit)
             for i in range(0, len(video_ids), 50):
+                if not self.quota.can_afford(1):
+                    print("⚠️ Not enough quota to fetch video durations")
+                    return None
                 batch = video_ids[i:i+50]
                 response = self.youtube.videos().list(
                     part='contentDetails',
-                    id=','.join(batch)
-                ).execute()
+                    id=','.join(batch),
+                    fields='items(id,contentDetails/duration)'
+                ).execute(num_retries=API_NUM_RETRIES)
                 self.quota.add_cost(1)
                 
                 for item in response.get('items', []):
@@ -472,24 +596,20 @@ class G3kYouTubePlaylistManager:
         except HttpError as e:
             if 'quotaExceeded' in str(e):
                 print("⚠️ API quota exceeded while fetching durations")
+            else:
+                print(f"Error fetching video durations: {e}")
+            return None
         
         return durations
     
-    def _parse_duration(self, duration: str) -> str:
-        """Convert ISO 8601 duration (PT4M13S) to readable format (4:13)."""
-        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration)
+    def _parse_duration(self, duration: str) -> int:
+        """Convert ISO 8601 duration (PT4M13S) to seconds (253)."""
+        match = ISO_DURATION_RE.match(duration)
         if not match:
-            return "0:00"
+            return 0
         
         hours, minutes, seconds = match.groups()
-        hours = int(hours) if hours else 0
-        minutes = int(minutes) if minutes else 0
-        seconds = int(seconds) if seconds else 0
-        
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes}:{seconds:02d}"
+        return (int(hours) if hours else 0) * 3600 + (int(minutes) if minutes else 0) * 60 + (int(seconds) if seconds else 0)
     
     def get_or_create_playlist(self, title: str) -> Optional[str]:
         if not self.quota.can_afford(1):
@@ -497,30 +617,57 @@ class G3kYouTubePlaylistManager:
             return None
         
         try:
-            # Search for existing playlist (1 quota unit per page)
-            next_page_token = None
-            while True:
-                if not self.quota.can_afford(1):
-                    break
-                    
-                playlists_response = self.youtube.playlists().list(
+            # Verify a cached playlist ID (1 quota unit) instead of paging through all playlists
+            cached_id = self.playlist_cache.get(title)
+            if cached_id:
+                response = self.youtube.playlists().list(
                     part='snippet',
-                    mine=True,
-                    maxResults=50,
-                    pageToken=next_page_token
-                ).execute()
+                    id=cached_id,
+                    fields='items(id,snippet/title)'
+                ).execute(num_retries=API_NUM_RETRIES)
                 self.quota.add_cost(1)
                 
+                items = response.get('items', [])
+                if items and items[0]['snippet']['title'] == title:
+                    if self.verbose:
+                        print(f"📦 Using cached playlist ID for: {title}")
+                    return cached_id
+                
+                # Deleted or renamed since it was cached
+                del self.playlist_cache[title]
+                self._playlist_cache_dirty = True
+            
+            # Search for existing playlist (1 quota unit per page); skipped if an earlier
+            # call this run already listed every playlist without finding this title
+            pages = () if self._playlist_scan_complete else self._iter_pages(
+                self.youtube.playlists().list,
+                part='snippet',
+                mine=True,
+                maxResults=50,
+                fields='nextPageToken,items(id,snippet/title)'
+            )
+            scanned_titles = set()
+            for playlists_response in pages:
+                # Remember every title seen so later playlists in this run skip the scan.
+                # The live listing wins over cached IDs; the first ID listed per title is kept.
+                found_id = None
                 for playlist in playlists_response.get('items', []):
-                    if playlist['snippet']['title'] == title:
-                        playlist_id = playlist['id']
-                        if self.verbose:
-                            print(f"📋 Found existing playlist: {title}")
-                        return playlist_id
+                    playlist_title = playlist['snippet']['title']
+                    if playlist_title not in scanned_titles:
+                        scanned_titles.add(playlist_title)
+                        if self.playlist_cache.get(playlist_title) != playlist['id']:
+                            self.playlist_cache[playlist_title] = playlist['id']
+                            self._playlist_cache_dirty = True
+                    if playlist_title == title and not found_id:
+                        found_id = playlist['id']
                 
-                next_page_token = playlists_response.get('nextPageToken')
-                if not next_page_token:
-                    break
+                if not playlists_response.get('nextPageToken'):
+                    self._playlist_scan_complete = True
+                
+                if found_id:
+                    if self.verbose:
+                        print(f"📋 Found existing playlist: {title}")
+                    return found_id
             
             # Create new playlist (50 quota units)
             if not self.quota.can_afford(50):
@@ -541,6 +688,8 @@ class G3kYouTubePlaylistManager:
             
             playlist_id = playlist_response['id']
             print(f"✨ Created new playlist: {title}")
+            self.playlist_cache[title] = playlist_id
+            self._playlist_cache_dirty = True
             return playlist_id
             
         except HttpError as e:
@@ -551,6 +700,10 @@ class G3kYouTubePlaylistManager:
             return None
     
     def get_existing_videos(self, playlist_id: str) -> set:
+        # Reuse a complete scan from earlier in this run (kept current as videos are added)
+        if playlist_id in self._existing_ids_by_playlist:
+            return self._existing_ids_by_playlist[playlist_id]
+        
         existing_ids = set()
         
         if not self.quota.can_afford(1):
@@ -558,26 +711,20 @@ class G3kYouTubePlaylistManager:
             return existing_ids
         
         try:
-            next_page_token = None
-            
-            while True:
-                if not self.quota.can_afford(1):
-                    break
-                
-                response = self.youtube.playlistItems().list(
-                    part='snippet',
-                    playlistId=playlist_id,
-                    maxResults=50,
-                    pageToken=next_page_token
-                ).execute()
-                self.quota.add_cost(1)
-                
-                for item in response['items']:
-                    existing_ids.add(item['snippet']['resourceId']['videoId'])
+            # contentDetails carries the video ID without the snippet's titles/thumbnails
+            pages = self._iter_pages(
+                self.youtube.playlistItems().list,
+                part='contentDetails',
+                playlistId=playlist_id,
+                maxResults=50,
+                fields='nextPageToken,items/contentDetails/videoId'
+            )
+            for response in pages:
+                for item in response.get('items', []):
+                    existing_ids.add(item['contentDetails']['videoId'])
                 
-                next_page_token = response.get('nextPageToken')
-                if not next_page_token:
-                    break
+                if not response.get('nextPageToken'):
+                    self._existing_ids_by_playlist[playlist_id] = existing_ids
             if self.verbose:
                 print(f"📊 Found {len(existing_ids)} existing videos in playlist")
             
@@ -590,14 +737,11 @@ class G3kYouTubePlaylistManager:
         return existing_ids
     
     def add_videos_to_playlist(self, playlist_id: str, playlist_title: str, videos: List[Dict[str, Any]], existing_ids: set):
-        global shutdown_requested
-        
         # Get previously added video IDs for this playlist
         previously_added = set(self.added_videos.get(playlist_title, {}).keys())
         
-        # Filter out existing videos and previously added videos, then sort by date
+        # Filter out existing and previously added videos (process_channels already dedupes across channels)
         new_videos = [v for v in videos if v['video_id'] not in existing_ids and v['video_id'] not in previously_added]
-        new_videos.sort(key=lambda x: x['published_at'])
         
         if not new_videos:
             if self.verbose:
@@ -608,6 +752,7 @@ class G3kYouTubePlaylistManager:
         
         added_count = 0
         added_videos = []
+        next_insert_at = 0.0
         
         for i, video in enumerate(new_videos, 1):
             if shutdown_requested:
@@ -619,6 +764,14 @@ class G3kYouTubePlaylistManager:
                 print(f"💡 Run again tomorrow to add remaining {len(new_videos) - i + 1} videos")
                 break
             
+            # Rate limiting: space insert starts apart, counting the previous request's own latency.
+            # Sleeping in short slices lets Ctrl-C interrupt the pause promptly.
+            wait = next_insert_at - time.monotonic()
+            if wait > 0 and interruptible_sleep(wait):
+                print(f"\n⏸️ Stopped by user after adding {added_count} videos")
+                break
+            next_insert_at = time.monotonic() + INSERT_INTERVAL_SECONDS
+            
             try:
                 self.youtube.playlistItems().insert(
                     part='snippet',
@@ -642,6 +795,7 @@ class G3kYouTubePlaylistManager:
                 # Log video entry to CSV log file
                 self._log_added_video_csv(playlist_title, video)
                 
+                existing_ids.add(video['video_id'])
                 added_count += 1
                 added_videos.append(video)
                 
@@ -649,9 +803,6 @@ class G3kYouTubePlaylistManager:
                 if i % 10 == 0:
                     print(f"    📊 Progress: {i}/{len(new_videos)} ({added_count} successful)")
                 
-                # Rate limiting
-                time.sleep(0.5)
-                
             except HttpError as e:
                 if 'quotaExceeded' in str(e):
                     print(f"\n⚠️ API quota exceeded after adding {added_count} videos")
@@ -688,24 +839,18 @@ class G3kYouTubePlaylistManager:
                 print(f"❌ Invalid start date format: {start_date}")
                 return False, []
         
+        end_cutoff = end_date + 'T23:59:59Z' if end_date else None
     
         if self.verbose:
             print(f"🎯 Target playlist: {playlist_title}")
             print(f"📊 Starting quota: {self.quota.remaining()}")
         
-        # Get or create playlist
-        playlist_id = self.get_or_create_playlist(playlist_title)
-        if not playlist_id:
-            return False, []
-        
-        # Get existing videos to avoid duplicates
-        existing_ids = self.get_existing_videos(playlist_id)
-        
         # Get previously added videos for this playlist
         previously_added = set(self.added_videos.get(playlist_title, {}).keys())
         
-        # Collect videos from all channels
-        all_videos = []
+        # Collect candidate videos from all channels; durations are fetched afterwards in
+        # one pass so videos.list batches of 50 IDs span channels instead of one call per channel
+        channel_batches = []
         for channel_entry in channels:
             if isinstance(channel_entry, dict):
                 channel_input = channel_entry.get('name', '')
@@ -717,9 +862,6 @@ class G3kYouTubePlaylistManager:
                 channel_input = str(channel_entry)
                 min_dur_raw = max_dur_raw = allow_regex = exclude_regex = None
 
-            min_dur_sec = parse_filter_duration_seconds(min_dur_raw)
-            max_dur_sec = parse_filter_duration_seconds(max_dur_raw)
-
             print(f"🔍 Processing: {channel_input}")
             
             channel_id = self.get_channel_id(channel_input)
@@ -730,61 +872,110 @@ class G3kYouTubePlaylistManager:
             videos = self.get_channel_videos(channel_id, since_date)
             
             # Filter by end date if specified
-            if end_date:
-                videos = [v for v in videos if v['published_at'] <= end_date + 'T23:59:59Z']
+            if end_cutoff:
+                videos = [v for v in videos if v['published_at'] <= end_cutoff]
             
-            # Filter candidate videos not in existing_ids or previously_added
-            channel_new_videos = [v for v in videos if v['video_id'] not in existing_ids and v['video_id'] not in previously_added]
+            # Filter candidate videos not in previously_added
+            channel_new_videos = [v for v in videos if v['video_id'] not in previously_added]
             
             if channel_new_videos:
-                # Fetch durations for candidate videos from this channel
-                new_video_ids = [v['video_id'] for v in channel_new_videos]
-                durations = self.get_video_durations(new_video_ids)
-                
-                for video in channel_new_videos:
-                    dur = durations.get(video['video_id'], '0:00')
-                    dur_sec = duration_to_seconds(dur)
-                    title = video.get('title', '')
+                channel_batches.append({
+                    'videos': channel_new_videos,
+                    'min_dur_raw': min_dur_raw,
+                    'min_dur_sec': parse_filter_duration_seconds(min_dur_raw),
+                    'max_dur_raw': max_dur_raw,
+                    'max_dur_sec': parse_filter_duration_seconds(max_dur_raw),
+                    'allow_regex': allow_regex,
+                    'exclude_regex': exclude_regex,
+                })
+            
+            if shutdown_requested:
+                break
+        
+        # Interrupted while collecting - don't spend quota on playlist lookups or creation
+        if shutdown_requested:
+            return False, []
+        
+        if not channel_batches:
+            if self.verbose:
+                print("📝 No new videos found")
+            return True, []  # Successful check, no playlist calls needed
+        
+        # Get or create playlist only once there are candidates to add
+        playlist_id = self.get_or_create_playlist(playlist_title)
+        if not playlist_id:
+            return False, []
+        
+        # Get existing videos to avoid duplicates
+        existing_ids = self.get_existing_videos(playlist_id)
+        for batch in channel_batches:
+            batch['videos'] = [v for v in batch['videos'] if v['video_id'] not in existing_ids]
+        
+        # Fetch durations for all candidate videos across channels
+        # (the same channel listed twice yields the same IDs; look each up once)
+        candidate_ids = list(dict.fromkeys(v['video_id'] for batch in channel_batches for v in batch['videos']))
+        durations = self.get_video_durations(candidate_ids)
+        if durations is None:
+            return False, []  # Retry these candidates next run rather than skip them as zero-length
+        
+        # Each channel's list is already sorted oldest-first, so merge rather than re-sort
+        # A video kept by an earlier channel entry is not queued again; entries for the
+        # same channel with different filters each still see every candidate
+        channel_videos = []
+        queued_ids = set()
+        for batch in channel_batches:
+            min_dur_raw, min_dur_sec = batch['min_dur_raw'], batch['min_dur_sec']
+            max_dur_raw, max_dur_sec = batch['max_dur_raw'], batch['max_dur_sec']
+            allow_regex, exclude_regex = batch['allow_regex'], batch['exclude_regex']
+            
+            kept = []
+            for video in batch['videos']:
+                if video['video_id'] in queued_ids:
+                    continue
+                dur_sec = durations.get(video['video_id'], 0)
+                dur = format_duration(dur_sec)
+                title = video.get('title', '')
 
-                    if dur in ('0:00', '0:00:00') or dur_sec == 0:
-                        if self.verbose:
-                            print(f"  ⏳ Skipping zero-length video (likely scheduled/upcoming): {title}")
-                        continue
+                # Also drops deleted/private upload placeholders, which videos.list returns nothing for
+                if dur_sec == 0:
+                    if self.verbose:
+                        print(f"  ⏳ Skipping zero-length video (likely scheduled/upcoming): {title}")
+                    continue
 
-                    if min_dur_sec is not None and dur_sec < min_dur_sec:
-                        if self.verbose:
-                            print(f"  ⏳ Skipping video under min_duration ({dur} < {min_dur_raw}): {title}")
-                        continue
+                if min_dur_sec is not None and dur_sec < min_dur_sec:
+                    if self.verbose:
+                        print(f"  ⏳ Skipping video under min_duration ({dur} < {min_dur_raw}): {title}")
+                    continue
 
-                    if max_dur_sec is not None and dur_sec > max_dur_sec:
-                        if self.verbose:
-                            print(f"  ⏳ Skipping video over max_duration ({dur} > {max_dur_raw}): {title}")
-                        continue
+                if max_dur_sec is not None and dur_sec > max_dur_sec:
+                    if self.verbose:
+                        print(f"  ⏳ Skipping video over max_duration ({dur} > {max_dur_raw}): {title}")
+                    continue
 
-                    if allow_regex and not re.search(allow_regex, title, re.IGNORECASE):
-                        if self.verbose:
-                            print(f"  ⏳ Skipping video not matching allow_regex ('{allow_regex}'): {title}")
-                        continue
+                if allow_regex and not re.search(allow_regex, title, re.IGNORECASE):
+                    if self.verbose:
+                        print(f"  ⏳ Skipping video not matching allow_regex ('{allow_regex}'): {title}")
+                    continue
 
-                    if exclude_regex and re.search(exclude_regex, title, re.IGNORECASE):
-                        if self.verbose:
-                            print(f"  ⏳ Skipping video matching exclude_regex ('{exclude_regex}'): {title}")
-                        continue
+                if exclude_regex and re.search(exclude_regex, title, re.IGNORECASE):
+                    if self.verbose:
+                        print(f"  ⏳ Skipping video matching exclude_regex ('{exclude_regex}'): {title}")
+                    continue
 
-                    video['duration'] = dur
-                    all_videos.append(video)
-                    print(f"  📺 {title} ({dur})")
-            
-            if shutdown_requested:
-                break
+                video['duration'] = dur
+                video['duration_seconds'] = dur_sec
+                queued_ids.add(video['video_id'])
+                kept.append(video)
+                print(f"  📺 {title} ({dur})")
+            channel_videos.append(kept)
+        
+        all_videos = list(heapq.merge(*channel_videos, key=itemgetter('published_at')))
         
         if not all_videos:
             if self.verbose:
                 print("📝 No videos found")
             return True, []  # Successful check, just no new videos
         
-        # Sort by publication date and add to playlist
-        all_videos.sort(key=lambda x: x['published_at'])
         if self.verbose:
             print(f"\n📊 Total videos found: {len(all_videos)}")
             if all_videos:
@@ -828,7 +1019,7 @@ def add_channel_to_playlist(config_file: str, playlist_name: str, channel: str):
         print(f"❌ Playlist '{playlist_name}' not found in config")
         return False
     
-    existing_channels = [c if isinstance(c, str) else c.get('name', '') for c in config['playlists'][playlist_name]['channels']]
+    existing_channels = {c if isinstance(c, str) else c.get('name', '') for c in config['playlists'][playlist_name]['channels']}
     if channel not in existing_channels:
         config['playlists'][playlist_name]['channels'].append(channel)
         save_playlist_config(config_file, config)
@@ -850,8 +1041,30 @@ def load_playlist_timestamps(timestamp_file: str) -> Dict[str, str]:
 
 def save_playlist_timestamps(timestamp_file: str, timestamps: Dict[str, str]):
     """Save per-playlist last update timestamps."""
-    with open(timestamp_file, 'w') as f:
-        json.dump(timestamps, f, indent=2)
+    write_json_atomic(timestamp_file, timestamps)
+
+def print_playlist_summary(playlist_title: str, videos: List[Dict[str, Any]], durations: Dict[str, int]):
+    """Print the end-of-run summary block for one playlist's added videos."""
+    # Durations were stored when the video was filtered; fall back to the summary lookup
+    seconds = [video.get('duration_seconds', durations.get(video['video_id'], 0)) for video in videos]
+    total_duration_seconds = sum(seconds)
+    
+    lines = [f"\n🎵 {playlist_title} ({len(videos)} videos):"]
+    for video, duration_seconds in zip(videos, seconds):
+        duration_str = video.get('duration') or format_duration(duration_seconds)
+        formatted_time = format_pacific_time(video['published_at'])
+        channel_title, title = video['channel_title'], video['title']
+        lines.append(f"  📺 {channel_title} - {title} ({duration_str}) ({formatted_time})")
+    
+    # Show total duration for playlist
+    if total_duration_seconds > 0:
+        hours, remainder = divmod(total_duration_seconds, 3600)
+        minutes = remainder // 60
+        if hours > 0:
+            lines.append(f"  ⏱️  Total duration: {hours}h {minutes}m")
+        else:
+            lines.append(f"  ⏱️  Total duration: {minutes}m")
+    print('\n'.join(lines))
 
 def main():
     signal.signal(signal.SIGINT, signal_handler)
@@ -870,6 +1083,7 @@ def main():
     
     args = parser.parse_args()
     
+    manager = None
     try:
         manager = G3kYouTubePlaylistManager(args.credentials, verbose=args.verbose)
         summary = {}  # Track added videos for final summary
@@ -884,6 +1098,8 @@ def main():
         
         # Legacy mode
         if args.channels and args.playlist_title:
+            if not manager.authenticate():
+                sys.exit(1)
             success, added_videos = manager.process_channels(args.channels, args.playlist_title, args.start_date, args.end_date)
             if added_videos:
                 summary[args.playlist_title] = added_videos
@@ -901,6 +1117,10 @@ def main():
                 playlists_to_process = [name for name, config_data in config['playlists'].items() 
                                       if not config_data.get('disabled', False)]
             
+            # Authenticate once for all playlists, and only if one will actually be processed
+            if any(name in config['playlists'] for name in playlists_to_process) and not manager.authenticate():
+                sys.exit(1)
+            
             for playlist_name in playlists_to_process:
                 if playlist_name not in config['playlists']:
                     print(f"❌ Playlist '{playlist_name}' not found in config")
@@ -950,38 +1170,12 @@ def main():
             print(f"\n📋 SUMMARY - Videos Added:")
             print("=" * 50)
             
-            # Collect all video IDs for duration lookup
-            all_video_ids = []
-            for videos in summary.values():
-                all_video_ids.extend([v['video_id'] for v in videos])
-            
-            # Get durations for all videos
-            durations = manager.get_video_durations(all_video_ids) if all_video_ids else {}
+            # Durations were recorded when the videos were filtered; only look up any that are missing
+            missing_ids = [v['video_id'] for videos in summary.values() for v in videos if not v.get('duration')]
+            durations = (manager.get_video_durations(missing_ids) or {}) if missing_ids else {}
             
             for playlist_title, videos in summary.items():
-                total_duration_seconds = 0
-                print(f"\n🎵 {playlist_title} ({len(videos)} videos):")
-                for video in videos:
-                    formatted_time = format_pacific_time(video['published_at'])
-                    duration_str = video.get('duration') or durations.get(video['video_id'], '0:00')
-                    print(f"  📺 {video['channel_title']} - {video['title']} ({duration_str}) ({formatted_time})")
-                    
-                    # Add to total duration
-                    if ':' in duration_str:
-                        parts = duration_str.split(':')
-                        if len(parts) == 2:  # MM:SS
-                            total_duration_seconds += int(parts[0]) * 60 + int(parts[1])
-                        elif len(parts) == 3:  # HH:MM:SS
-                            total_duration_seconds += int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                
-                # Show total duration for playlist
-                if total_duration_seconds > 0:
-                    hours = total_duration_seconds // 3600
-                    minutes = (total_duration_seconds % 3600) // 60
-                    if hours > 0:
-                        print(f"  ⏱️  Total duration: {hours}h {minutes}m")
-                    else:
-                        print(f"  ⏱️  Total duration: {minutes}m")
+                print_playlist_summary(playlist_title, videos, durations)
         else:
             print(f"\n📋 SUMMARY - No videos were added to any playlist")
         
@@ -1003,6 +1197,9 @@ def main():
     except Exception as e:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
+    finally:
+        if manager:
+            manager.flush_caches()
 
 if __name__ == '__main__':
     main()